@@ -1,3 +1,6 @@
+from functools import lru_cache
+from os import listdir, scandir, stat
+from os.path import abspath, basename, dirname, exists, isabs, join
 from typing import TYPE_CHECKING
 
 from openforbc_benchmark.json import (
@@ -58,6 +61,7 @@ class Benchmark(BenchmarkDefinition):
         stats: "Union[CommandInfo, Dict[str, StatMatchInfo]]",
         virtualenv: bool,
         dir: str,
+        parallel_safe: bool = False,
     ) -> None:
         """Create a Benchmark object."""
         super().__init__(
@@ -71,8 +75,10 @@ class Benchmark(BenchmarkDefinition):
             test_commands,
             stats,
             virtualenv,
+            parallel_safe,
         )
         self.dir = dir
+        self._id: "Optional[str]" = None
 
     @classmethod
     def from_definition(
@@ -94,28 +100,24 @@ class Benchmark(BenchmarkDefinition):
             self.test_commands,
             self.stats,
             self.virtualenv,
+            self.parallel_safe,
         )
 
     @classmethod
     def from_definition_file(self_class, path: str) -> "Benchmark":
         """Create a Benchmark object from its definiton file path."""
-        from os.path import dirname
-
         return self_class.from_definition(
             BenchmarkDefinition.from_file(path), dirname(path)
         )
 
     def get_id(self) -> str:
         """Get benchmark ID (folder basename)."""
-        from os.path import basename
-
-        return basename(self.dir)
+        if self._id is None:
+            self._id = basename(self.dir)
+        return self._id
 
     def get_presets(self) -> "List[Preset]":
         """Get benchmark presets' names."""
-        from os import listdir
-        from os.path import join
-
         presets_dir = join(self.dir, "presets")
         return [
             Preset.from_definition_file(join(presets_dir, file))
@@ -139,8 +141,6 @@ class Benchmark(BenchmarkDefinition):
 
     def get_preset(self, name: str) -> "Optional[Preset]":
         """Get (eventually) benchmark's preset by name."""
-        from os.path import exists, join
-
         presets_dir = join(self.dir, "presets")
 
         filename = name if name.endswith(".json") else name + ".json"
@@ -182,8 +182,6 @@ class Preset(PresetDefinition):
     @classmethod
     def from_definition_file(self_class, path: str) -> "Preset":
         """Create a Preset from its definition file path."""
-        from os.path import basename
-
         filename = basename(path)
 
         name = filename[:-5] if filename.endswith(".json") else filename
@@ -280,8 +278,6 @@ class BenchmarkRun:
 
     def setup(self) -> "Iterator[Runnable]":
         """Get tasks for this benchmark run setup commands."""
-        from os.path import join
-
         # (Eventually) create a virtualenv for the benchmark
         if self.benchmark.virtualenv:
             yield self._add_context(Runnable(["python3", "-m", "venv", ".venv"]))
@@ -321,7 +317,6 @@ class BenchmarkRun:
         from json import load, loads
         from json.decoder import JSONDecodeError
         from jsonschema import validate, ValidationError
-        from os.path import abspath, dirname, join
         from re import compile
         from subprocess import PIPE, run
 
@@ -429,8 +424,6 @@ class BenchmarkRun:
         Will add benchmark's directory as cwd and (eventually) set up a python virtualenv
         to isolate this benchmark.
         """
-        from os.path import isabs, join
-
         run_env = runnable.env.copy() if runnable.env is not None else None
         if self._virtualenv is not None:
             new_env = {
@@ -461,33 +454,89 @@ class BenchmarkRun:
         )
 
 
-def get_benchmarks(search_path: str) -> "Iterator[Benchmark]":
+@lru_cache(maxsize=None)
+def get_search_dirs(search_path: str, folder: str) -> "Tuple[str, ...]":
     """
-    Get all the benchmarks in the search path.
+    Get the directories to look into for a search path (results are cached).
+
+    :param search_path: colon separated list of directories, empty entries are
+        skipped.
+    :param folder: name of the folder to look into in each directory (such as
+        "benchmarks").
+    """
+    return tuple(join(x, folder) for x in search_path.split(":") if x)
+
+
+@lru_cache(maxsize=None)
+def _load_benchmark(path: str, mtime: float) -> Benchmark:
+    """
+    Load a benchmark from its definition file, caching the result.
+
+    :param path: benchmark definition file path.
+    :param mtime: definition file modification time, only used as part of the cache
+        key so that edited definitions get loaded again.
+    """
+    return Benchmark.from_definition_file(path)
+
+
+def load_benchmark(path: str) -> Benchmark:
+    """Load a benchmark from its definition file path (results are cached)."""
+    return _load_benchmark(path, stat(path).st_mtime)
+
+
+def iter_benchmark_dirs(search_path: str) -> "Iterator[Tuple[str, str]]":
+    """
+    Get the benchmark directories in the search path, without loading them.
 
     :param search_path: colon separated list of directories in which to search for
         benchmarks.
+    :returns: an Iterator into tuples containing the benchmark ID (directory name)
+        and its definition file path.
     """
-    from os import listdir
-    from os.path import exists, join
-
-    for path in [join(x, "benchmarks") for x in search_path.split(":")]:
+    for path in get_search_dirs(search_path, "benchmarks"):
         try:
-            for dir in listdir(path):
-                if exists(join(path, dir, "benchmark.json")):
-                    yield Benchmark.from_definition_file(
-                        join(path, dir, "benchmark.json")
-                    )
+            with scandir(path) as entries:
+                for entry in entries:
+                    # `is_dir` uses the file type returned along with the directory
+                    # listing, skipping files without an extra stat
+                    if not entry.is_dir():
+                        continue
+                    definition_path = join(entry.path, "benchmark.json")
+                    if exists(definition_path):
+                        yield entry.name, definition_path
         except (FileNotFoundError, NotADirectoryError):
             continue
 
 
+def get_benchmarks(search_path: str) -> "Iterator[Benchmark]":
+    """
+    Get all the benchmarks in the search path.
+
+    :param search_path: colon separated list of directories in which to search for
+        benchmarks.
+    """
+    for _, definition_path in iter_benchmark_dirs(search_path):
+        yield load_benchmark(definition_path)
+
+
 def find_benchmark(id: str, search_path: str) -> "Optional[Benchmark]":
     """
     Find a benchmark by ID in the search path.
 
+    Since the ID is the benchmark's directory name, only the matching definition
+    file is loaded.
+
     :param id: id of the benchmark (directory name)
     :param search_path: colon separated list of directories in which to search for
         benchmarks.
     """
-    return next((x for x in get_benchmarks(search_path) if x.get_id() == id), None)
+    if id in ("", ".", "..") or basename(id) != id:
+        return None
+
+    for path in get_search_dirs(search_path, "benchmarks"):
+        try:
+            return load_benchmark(join(path, id, "benchmark.json"))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+    return None
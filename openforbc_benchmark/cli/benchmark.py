@@ -1,7 +1,15 @@
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from io import BytesIO, TextIOWrapper
+from itertools import chain
 from json import dumps
-from tabulate import tabulate
-from os.path import join
+from os import get_terminal_size, getcwd, makedirs, mkdir, read
+from os.path import dirname, join
+from selectors import DefaultSelector, EVENT_READ
+from subprocess import PIPE, Popen
 from sys import stdout
+from textwrap import shorten
+from threading import Event, Lock
+from time import localtime, strftime
 from typer import Context, echo, Exit, Typer, Option  # noqa: TC002
 from typer.params import Argument
 from typing import List  # noqa: TC002
@@ -17,14 +25,18 @@ from openforbc_benchmark.benchmark import (
 )
 from openforbc_benchmark.cli.state import state
 from openforbc_benchmark.json import CommandInfo
-from openforbc_benchmark.utils import argv_join
+from openforbc_benchmark.utils import argv_join, format_table
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Tuple, Union
+    from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Union
     from openforbc_benchmark.benchmark import Benchmark, BenchmarkRun, Preset
     from openforbc_benchmark.json import StatMatchInfo
     from openforbc_benchmark.utils import Runnable
 
+# Size of task output reads and of log file write buffers: lines are batched into
+# (at most) one write syscall per 64 KiB of output
+IO_CHUNK_SIZE = 1 << 16
+
 
 class BenchmarkRunException(Exception):
     pass
@@ -54,152 +66,280 @@ class CliBenchmarkRun:
     def __init__(
         self, benchmark_run: "BenchmarkRun", log_to_stderr: bool = not stdout.isatty()
     ) -> None:
-        from datetime import datetime
-        from os import mkdir
-        from os.path import dirname, exists
-
         self.benchmark_run = benchmark_run
         self.spinner = Yaspin()
         self.log_dir = join(
             get_benchmark_log_dir(benchmark_run.benchmark),
-            datetime.now().strftime("%Y%m%d_%H%M%S"),
+            strftime("%Y%m%d_%H%M%S", localtime()),
         )
         self.stats: "Dict[str, Dict[str, Union[int, float]]]" = {}
         self._log_to_stderr = log_to_stderr
+        # Presets can run in parallel threads sharing the spinner and the output
+        self._lock = Lock()
 
-        parent = dirname(self.log_dir)
-        if exists(self.log_dir):
-            i = 1
-            while exists(f"{self.log_dir}.{i}"):
-                i += 1
-            self.log_dir = f"{self.log_dir}.{i}"
-        elif not exists(parent):
-            mkdir(parent)
+        makedirs(dirname(self.log_dir), exist_ok=True)
 
-        mkdir(self.log_dir)
+        # Runs started in the same second get a numeric suffix: mkdir fails
+        # atomically on existing directories, so concurrent runs can't collide
+        base_log_dir, i = self.log_dir, 0
+        while True:
+            try:
+                mkdir(self.log_dir)
+                break
+            except FileExistsError:
+                i += 1
+                self.log_dir = f"{base_log_dir}.{i}"
 
     def print_stats(self, json: bool = False) -> None:
         """Print benchmark stats to output."""
         if json:
             return echo(dumps(self.stats))
 
-        table: "List[Tuple[str, str, Union[int, float]]]" = []
-        for preset, preset_stats in self.stats.items():
-            table.extend((preset, stat, value) for stat, value in preset_stats.items())
+        table: "List[Tuple[str, str, Union[int, float]]]" = list(
+            chain.from_iterable(
+                ((preset, stat, value) for stat, value in preset_stats.items())
+                for preset, preset_stats in self.stats.items()
+            )
+        )
 
-        echo(tabulate(table, ["Preset", "Stat", "Value"]))
+        echo(format_table(table, ["Preset", "Stat", "Value"]))
 
-    def start(self, test_only: bool = False) -> None:
-        """Run the benchmark (interface method)."""
+    def start(self, test_only: bool = False, parallel: int = 1) -> None:
+        """
+        Run the benchmark (interface method).
+
+        :param test_only: run the benchmark's test commands instead of its presets.
+        :param parallel: maximum number of presets to run concurrently, only used if
+            the benchmark is marked as `parallel_safe`.
+        """
         if self._log_to_stderr:
             self._run_setup()
-            self._run_test() if test_only else self._run()
+            self._run_test() if test_only else self._run(parallel)
         else:
             with self.spinner:
                 self._run_setup()
-                self._run_test() if test_only else self._run()
+                self._run_test() if test_only else self._run(parallel)
 
-    def _run(self) -> None:
+    def _run(self, parallel: int = 1) -> None:
         """Run the benchmark."""
+        benchmark = self.benchmark_run.benchmark
+        presets = self.benchmark_run.presets
+
+        # No need for a thread pool to run a single preset
+        parallel = min(parallel, len(presets))
+        if parallel > 1 and not benchmark.parallel_safe:
+            self._log(
+                f'WARNING: Benchmark "{benchmark.get_id()}" is not marked as '
+                "parallel_safe, running presets sequentially",
+                err=True,
+            )
+            parallel = 1
+        elif parallel > 1 and len({preset.name for preset in presets}) != len(presets):
+            # Presets sharing a name would also share their log files
+            self._log(
+                "WARNING: Repeated presets can't run in parallel, running presets "
+                "sequentially",
+                err=True,
+            )
+            parallel = 1
+
+        if parallel > 1:
+            results = self._run_parallel(parallel)
+        else:
+            results = [
+                self._run_preset(preset, tasks)
+                for preset, tasks in self.benchmark_run.run()
+            ]
+
+        for preset, stats in zip(presets, results):
+            if stats is not None:
+                self.stats[preset.name] = stats
+
+    def _run_parallel(
+        self, max_workers: int
+    ) -> "List[Optional[Dict[str, Union[int, float]]]]":
+        """
+        Run the benchmark's presets concurrently.
+
+        Stops at the first failure: presets that haven't started yet are skipped and
+        the failure is raised as soon as the running ones are done.
+
+        :param max_workers: maximum number of presets to run concurrently.
+        :returns: each preset's stats (see `_run_preset`), in order.
+        """
         benchmark_id = self.benchmark_run.benchmark.get_id()
+        failed = Event()
+        running: List[str] = []
 
-        for preset, tasks in self.benchmark_run.run():
-            self._log(f'Running "{benchmark_id}" preset "{preset.name}"')
-            for i, task in enumerate(tasks):
-                from os import get_terminal_size
-                from textwrap import shorten
-
-                self.spinner.text = shorten(
-                    f"{benchmark_id}(run:{preset.name}): {argv_join(task.args)}",
-                    # spinner uses 2 chars
-                    (get_terminal_size().columns if stdout.isatty() else 80) - 2,
-                    placeholder="...",
-                )
-                self._run_task_or_err(
-                    task,
-                    join(self.log_dir, f"run_{preset.name}.{i + 1}"),
-                    f'Benchmark "{benchmark_id}" preset "{preset.name}" command '
-                    f'"{argv_join(task.args)}" failed',
-                )
-                last_task_i = i
+        def set_spinner_text() -> None:
+            # Show all the running presets instead of the last started command
+            self._set_spinner_text(f"{benchmark_id}(run:{','.join(running)})")
 
-            out_filename = join(
-                self.log_dir, f"run_{preset.name}.{last_task_i + 1}.out.log"
-            )
+        def run_preset(
+            preset: "Preset", tasks: "Iterator[Runnable]"
+        ) -> "Optional[Dict[str, Union[int, float]]]":
+            # The worker that ran the failed preset can pick up the next one before
+            # it gets cancelled
+            if failed.is_set():
+                return None
+
+            with self._lock:
+                running.append(preset.name)
+                set_spinner_text()
 
             try:
-                if isinstance(self.benchmark_run.benchmark.stats, CommandInfo):
-                    self.stats[preset.name] = self.benchmark_run.get_stats(out_filename)
-                else:
-                    with open(out_filename, "r") as output:
-                        next(output)
-                        self.stats[preset.name] = self.benchmark_run.get_stats(output)
-            except BenchmarkStatsDecodeError as e:
-                self._log("ERROR: stats script output:", err=True)
-                self._log(e.output.rstrip(), err=True)
-                self._fail(
-                    BenchmarkRunStatsError(
-                        f'"{benchmark_id}" preset "{preset.name}" stats decode '
-                        f"failed: {e}"
-                    ),
-                )
-            except BenchmarkStatsMatchError as e:
-                self._fail(
-                    BenchmarkRunStatsError(
-                        f'"{benchmark_id}" preset "{preset.name}" stats match failed: '
-                        f"{e}"
-                    )
+                return self._run_preset(preset, tasks, parallel=True)
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                with self._lock:
+                    running.remove(preset.name)
+                    set_spinner_text()
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(run_preset, preset, tasks)
+                for preset, tasks in self.benchmark_run.run()
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+        finally:
+            # Don't start other presets after a failure (or an interrupt), wait for
+            # the running ones
+            executor.shutdown(cancel_futures=True)
+
+        for future in futures:
+            exception = None if future.cancelled() else future.exception()
+            if exception is not None:
+                raise exception
+
+        return [future.result() for future in futures]
+
+    def _run_preset(
+        self, preset: "Preset", tasks: "Iterator[Runnable]", parallel: bool = False
+    ) -> "Optional[Dict[str, Union[int, float]]]":
+        """
+        Run a benchmark preset's tasks.
+
+        :param preset: the preset to run.
+        :param tasks: the preset's tasks.
+        :param parallel: `True` if other presets are running concurrently, tags the
+            tasks' output with the preset name.
+        :returns: the preset's stats, `None` if they couldn't be decoded.
+        """
+        benchmark_id = self.benchmark_run.benchmark.get_id()
+        # Regex stats are matched against the last task's stdout, which is kept in
+        # memory while being logged instead of being read back from its log file
+        match_output = not isinstance(self.benchmark_run.benchmark.stats, CommandInfo)
+
+        log_prefix = join(self.log_dir, f"run_{preset.name}")
+        output_prefix = f"[{preset.name}] " if parallel else ""
+
+        self._log(f'Running "{benchmark_id}" preset "{preset.name}"')
+        for i, task in enumerate(tasks):
+            command = argv_join(task.args)
+            if not parallel:
+                self._set_spinner_text(f"{benchmark_id}(run:{preset.name}): {command}")
+            output = BytesIO() if match_output else None
+            self._run_task_or_err(
+                task,
+                f"{log_prefix}.{i + 1}",
+                f'Benchmark "{benchmark_id}" preset "{preset.name}" command '
+                f'"{command}" failed',
+                output,
+                output_prefix,
+            )
+            last_task_i = i
+
+        out_filename = f"{log_prefix}.{last_task_i + 1}.out.log"
+
+        try:
+            if output is None:
+                return self.benchmark_run.get_stats(out_filename)
+
+            output.seek(0)
+            return self.benchmark_run.get_stats(TextIOWrapper(output, errors="replace"))
+        except BenchmarkStatsDecodeError as e:
+            self._log("ERROR: stats script output:", err=True)
+            self._log(e.output.rstrip(), err=True)
+            self._fail(
+                BenchmarkRunStatsError(
+                    f'"{benchmark_id}" preset "{preset.name}" stats decode '
+                    f"failed: {e}"
+                ),
+            )
+        except BenchmarkStatsMatchError as e:
+            self._fail(
+                BenchmarkRunStatsError(
+                    f'"{benchmark_id}" preset "{preset.name}" stats match failed: '
+                    f"{e}"
                 )
+            )
+
+        return None
 
     def _run_setup(self) -> None:
         """Run benchmark's setup tasks."""
         benchmark_id = self.benchmark_run.benchmark.get_id()
+        log_prefix = join(self.log_dir, "setup")
 
         self._log(f'Running "{benchmark_id}" setup commands')
         for i, task in enumerate(self.benchmark_run.setup()):
-            self.spinner.text = f"{benchmark_id}(setup): {argv_join(task.args)}"
+            command = argv_join(task.args)
+            self.spinner.text = f"{benchmark_id}(setup): {command}"
             self._run_task_or_err(
                 task,
-                join(self.log_dir, f"setup.{i + 1}"),
-                f'Benchmark "{benchmark_id}" setup command "{argv_join(task.args)}" '
-                "failed",
+                f"{log_prefix}.{i + 1}",
+                f'Benchmark "{benchmark_id}" setup command "{command}" failed',
             )
 
     def _run_test(self) -> None:
         """Run benchmark's test tasks."""
         benchmark_id = self.benchmark_run.benchmark.get_id()
+        log_prefix = join(self.log_dir, "setup")
 
         self._log(f'Running "{benchmark_id}" test commands')
         for i, task in enumerate(self.benchmark_run.test()):
-            self.spinner.text = f"{benchmark_id}(test): {argv_join(task.args)}"
+            command = argv_join(task.args)
+            self.spinner.text = f"{benchmark_id}(test): {command}"
             self._run_task_or_err(
                 task,
-                join(self.log_dir, f"setup.{i + 1}"),
-                f'Benchmark "{benchmark_id}" test command "{argv_join(task.args)}" '
-                "failed",
+                f"{log_prefix}.{i + 1}",
+                f'Benchmark "{benchmark_id}" test command "{command}" failed',
             )
 
+    def _set_spinner_text(self, text: str) -> None:
+        """Set the spinner text, shortened to fit in the terminal."""
+        self.spinner.text = shorten(
+            text,
+            # spinner uses 2 chars
+            (get_terminal_size().columns if stdout.isatty() else 80) - 2,
+            placeholder="...",
+        )
+
     def _fail(self, exception: BenchmarkRunException) -> None:
         """
         Terminate the execution printing an exception into stderr.
 
         :param exception: exception that caused the failure.
         """
-        self.spinner.stop()
+        with self._lock:
+            self.spinner.stop()
+
+            echo(exception, err=True)
+            if isinstance(exception, BenchmarkRunStatsError):
+                echo(
+                    f"WARNING: Stats decode for benchmark "
+                    f'"{self.benchmark_run.benchmark.get_id()}" failed',
+                    err=True,
+                )
+                return
 
-        echo(exception, err=True)
-        if isinstance(exception, BenchmarkRunStatsError):
             echo(
-                f"WARNING: Stats decode for benchmark "
-                f'"{self.benchmark_run.benchmark.get_id()}" failed',
+                f'ERROR: Benchmark "{self.benchmark_run.benchmark.get_id()}" failed',
                 err=True,
             )
-            return
-
-        echo(
-            f'ERROR: Benchmark "{self.benchmark_run.benchmark.get_id()}" failed',
-            err=True,
-        )
         raise Exit(1)
 
     def _log(self, message: "Any", err: bool = True) -> None:
@@ -209,11 +349,29 @@ class CliBenchmarkRun:
         :param message: message to log.
         :param err: `True` to use stderr, `False` for stdout.
         """
-        with self.spinner.hidden():
+        with self._lock, self.spinner.hidden():
+            echo(message, err=(self._log_to_stderr or err))
+
+    def _log_now(self, message: "Any", err: bool = True) -> None:
+        """
+        Stop the spinner and log a message to stdout/err.
+
+        To be used right before failing, as it doesn't start the spinner again.
+
+        :param message: message to log.
+        :param err: `True` to use stderr, `False` for stdout.
+        """
+        with self._lock:
+            self.spinner.stop()
             echo(message, err=(self._log_to_stderr or err))
 
     def _run_task_or_err(
-        self, task: "Runnable", log_prefix: str, err_message: "Any"
+        self,
+        task: "Runnable",
+        log_prefix: str,
+        err_message: "Any",
+        tee: "Optional[BinaryIO]" = None,
+        output_prefix: str = "",
     ) -> None:
         """
         Run a task, eventually failing with an exception.
@@ -221,18 +379,20 @@ class CliBenchmarkRun:
         :param task: the task to run.
         :param log_prefix: output filename prefix.
         :param err_message: error message to be shown when the task fails.
+        :param tee: binary file in which to copy the task's stdout (optional).
+        :param output_prefix: prefix of each echoed line of the task's output.
         """
         try:
-            ret = self._run_task(task, log_prefix)
+            ret = self._run_task(task, log_prefix, tee, output_prefix)
         except Exception as e:
-            self._log(err_message, err=True)
+            self._log_now(err_message, err=True)
             self._fail(BenchmarkTaskError(f"Task {task} did not start because of {e}"))
 
         if ret != 0:
             if ret == 1 and "venv" in task.args:
                 with open(f"{log_prefix}.err.log", "r") as output:
                     if "Error: [Errno 2] No such file or directory:" in output.read():
-                        self._log(
+                        self._log_now(
                             "WARNING: Possibly broken symbolic link in benchmark's "
                             f"virtualenv ({self.benchmark_run.benchmark.dir}/.venv), "
                             "delete it and try again",
@@ -240,21 +400,36 @@ class CliBenchmarkRun:
                         )
                 pass
 
-            self._log(err_message, err=True)
+            self._log_now(err_message, err=True)
             self._fail(
                 BenchmarkTaskFailed(f"Task {task} failed with return code {ret}")
             )
 
-    def _run_task(self, task: "Runnable", log_prefix: str) -> int:
-        """Run the task."""
-        from selectors import DefaultSelector, EVENT_READ
-        from subprocess import PIPE, Popen
-        from time import sleep
-        from typing import cast, IO
-
-        self._log(task)
+    def _run_task(
+        self,
+        task: "Runnable",
+        log_prefix: str,
+        tee: "Optional[BinaryIO]" = None,
+        output_prefix: str = "",
+    ) -> int:
+        """
+        Run the task.
 
-        proc = Popen(**task.into_popen_args(), stderr=PIPE, stdout=PIPE)
+        :param task: the task to run.
+        :param log_prefix: output filename prefix.
+        :param tee: binary file in which to copy the task's stdout (optional).
+        :param output_prefix: prefix of each echoed line of the task's output.
+        """
+        # Task representation (used for both logs' header)
+        task_repr = str(task)
+        self._log(f"{output_prefix}{task_repr}")
+
+        # File descriptors opened by python are non-inheritable by default (PEP 446),
+        # including other tasks' pipes and logs when running presets in parallel, so
+        # there's no need to close all of them in the child before exec
+        proc = Popen(
+            **task.into_popen_args(), stderr=PIPE, stdout=PIPE, close_fds=False
+        )
         assert proc.stdout is not None
         assert proc.stderr is not None
 
@@ -262,37 +437,74 @@ class CliBenchmarkRun:
         outsel = DefaultSelector()
         outsel.register(proc.stdout, EVENT_READ)
         outsel.register(proc.stderr, EVENT_READ)
-
-        with outsel, open(f"{log_prefix}.err.log", "w") as err_log, open(
-            f"{log_prefix}.out.log", "w"
+        # Trailing incomplete line read from each pipe (by file descriptor)
+        partial = {proc.stdout.fileno(): bytearray(), proc.stderr.fileno(): bytearray()}
+
+        # Log files are written as raw bytes through a large buffer to avoid a write
+        # syscall (and a decode) for every line of output
+        with outsel, open(
+            f"{log_prefix}.err.log", "wb", buffering=IO_CHUNK_SIZE
+        ) as err_log, open(
+            f"{log_prefix}.out.log", "wb", buffering=IO_CHUNK_SIZE
         ) as out_log:
-            err_log.write(f"{task}\n")
-            out_log.write(f"{task}\n")
+            header = f"{task_repr}\n".encode()
+            err_log.write(header)
+            out_log.write(header)
 
             reading = True
             while reading:
                 for k, _ in outsel.select():
-                    # Try to read a line from either stdout or stderr
-                    line = cast(IO[bytes], k.fileobj).readline()
-                    if not line:
+                    # Read a chunk of output from either stdout or stderr, one syscall
+                    # can return many lines
+                    chunk = read(k.fd, IO_CHUNK_SIZE)
+                    pending = partial[k.fd]
+                    if not chunk:
                         # Unregister ended fileobj
                         outsel.unregister(k.fileobj)
                         if not outsel.get_map():  # No more output
                             reading = False
+                        # Flush the last line even if it's missing its newline
+                        lines = bytes(pending)
+                    else:
+                        # Only handle complete lines, keep the rest for later. The
+                        # pending partial line has no newline, so only the new chunk
+                        # needs to be searched (and the partial line is copied once)
+                        end = chunk.rfind(b"\n") + 1
+                        if not end and len(pending) + len(chunk) > IO_CHUNK_SIZE:
+                            # Don't let output without newlines (e.g. progress bars
+                            # using `\r`) pile up: flush it, up to its last `\r` if any
+                            end = chunk.rfind(b"\r") + 1 or len(chunk)
+                        if not end:
+                            pending += chunk
+                            continue
+
+                        lines = bytes(pending) + chunk[:end]
+                        pending[:] = chunk[end:]
+
+                    if not lines:
                         continue
 
-                    self._log(line.rstrip().decode())
-
-                    # Write line to err/out log file
-                    log_file = err_log if k.fileobj is proc.stderr else out_log
-                    log_file.write(
-                        line.decode() if line.endswith(b"\n") else line.decode() + "\n"
+                    # Decode all the lines at once, `lines` ends with a newline (or a
+                    # `\r`) so it can't end in the middle of a multibyte character,
+                    # unless it's a long line being flushed. They're also echoed at
+                    # once, not interleaved with other presets' lines
+                    self._log(
+                        "\n".join(
+                            f"{output_prefix}{line.rstrip()}"
+                            for line in lines.decode(errors="replace")
+                            .removesuffix("\n")
+                            .split("\n")
+                        )
                     )
 
-        while proc.poll() is None:
-            sleep(0.05)
+                    # Write lines to err/out log file
+                    log_file = err_log if k.fileobj is proc.stderr else out_log
+                    log_file.write(lines)
+                    if tee is not None and log_file is out_log:
+                        tee.write(lines)
 
-        return proc.returncode
+        # Both pipes are closed, just reap the child process
+        return proc.wait()
 
 
 def find_benchmark_or_fail(benchmark_id: str) -> "Benchmark":
@@ -320,17 +532,16 @@ def get_preset_or_fail(benchmark: "Benchmark", preset_name: str) -> "Preset":
 
 def get_benchmark_log_dir(benchmark: "Benchmark") -> str:
     """Get log directory for a benchmark."""
-    from os import getcwd, mkdir
-    from os.path import exists
-
     log_dir = join(getcwd(), "logs")
 
-    if not exists(log_dir):
+    try:
         mkdir(log_dir)
         echo(
             'WARNING: Log directory "logs" not found in current directory, creating it',
             err=True,
         )
+    except FileExistsError:
+        pass
 
     return join(getcwd(), "logs", benchmark.get_id())
 
@@ -357,26 +568,28 @@ app = Typer(help="List, inspect and run benchmark and presets")
 @app.command("list")
 def list_benchmarks(table: bool = Option(False, "--table", "-t")) -> None:
     """List benchmarks in the search path."""
-    from textwrap import shorten
-
     benchmarks = get_benchmarks(state["search_path"])
 
+    if not table:
+        # Print each benchmark as soon as it's found
+        for benchmark in benchmarks:
+            echo(benchmark.get_id())
+        return
+
+    # The table needs every row to compute column widths
     echo(
-        tabulate(
-            map(
-                lambda benchmark: (
+        format_table(
+            (
+                (
                     benchmark.get_id(),
                     shorten(benchmark.name, 20, placeholder="..."),
                     shorten(benchmark.description, 40, placeholder="..."),
                     benchmark.default_preset,
-                ),
-                benchmarks,
+                )
+                for benchmark in benchmarks
             ),
-            headers=["ID", "Name", "Description", "Default preset"],
-            tablefmt="simple",
+            ["ID", "Name", "Description", "Default preset"],
         )
-        if table
-        else "\n".join(map(lambda bench: bench.get_id(), benchmarks))
     )
 
 
@@ -393,12 +606,12 @@ def list_presets(
     presets = benchmark.get_presets()
 
     echo(
-        tabulate(
+        format_table(
             [
                 (preset.name, argv_join(preset.args) if preset.args else None)
                 for preset in presets
             ],
-            headers=["Name", "Args"],
+            ["Name", "Args"],
         )
         if table
         else "\n".join(preset.name for preset in presets)
@@ -472,6 +685,7 @@ def run_benchmark(
     preset_names: "List[str]" = Argument(None),  # noqa: TC201
     use_test_preset: bool = Option(False, "--test-preset", "-t"),
     json: bool = Option(False, "--json", "-j"),
+    parallel: int = Option(1, "--parallel", "-p", min=1),
 ) -> None:
     """Run specified benchmark with one or more presets."""
     # typer has a bug and arguments specified as lists get passed as tuples
@@ -506,7 +720,7 @@ def run_benchmark(
     run = benchmark.run(presets)
 
     cli_run = CliBenchmarkRun(run)
-    cli_run.start()
+    cli_run.start(parallel=parallel)
     cli_run.print_stats(json)
 
 
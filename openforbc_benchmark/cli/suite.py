@@ -1,11 +1,17 @@
+from itertools import chain
 from sys import stdout
 from typer import Context, echo, Exit, Typer, Option  # noqa: TC002
 from typing import TYPE_CHECKING
 
-from openforbc_benchmark.benchmark import BenchmarkSuite, get_benchmarks
+from openforbc_benchmark.benchmark import (
+    BenchmarkSuite,
+    get_benchmarks,
+    get_search_dirs,
+)
 from openforbc_benchmark.json import BenchmarkRunDefinition, BenchmarkSuiteDefinition
 from openforbc_benchmark.cli.benchmark import CliBenchmarkRun
 from openforbc_benchmark.cli.state import state
+from openforbc_benchmark.utils import format_table
 
 if TYPE_CHECKING:
     from typing import Dict, Iterator, List, Optional, Tuple, Union
@@ -26,21 +32,21 @@ class CliBenchmarkSuiteRun:
     def print_stats(self, json: bool = False) -> None:
         """Print benchmark suite's stats."""
         from json import dumps
-        from tabulate import tabulate
 
         if json:
             return echo(dumps(self.stats))
 
         for i, run_stats in enumerate(self.stats):
-            table: "List[Tuple[str, str, Union[int, float]]]" = []
             echo()
             echo(f"RUN#{i + 1} - {self.suite.benchmark_runs[i].benchmark.name}")
-            for preset, preset_stats in run_stats.items():
-                table.extend(
-                    (preset, stat, value) for stat, value in preset_stats.items()
+            table: "List[Tuple[str, str, Union[int, float]]]" = list(
+                chain.from_iterable(
+                    ((preset, stat, value) for stat, value in preset_stats.items())
+                    for preset, preset_stats in run_stats.items()
                 )
+            )
 
-            echo(tabulate(table, ["Preset", "Stat", "Value"]))
+            echo(format_table(table, ["Preset", "Stat", "Value"]))
 
     def start(self) -> None:
         """Run this benchmark suite."""
@@ -56,7 +62,7 @@ def get_suites(search_path: str) -> "Iterator[BenchmarkSuite]":
     from os import listdir
     from os.path import isfile, join
 
-    for dir in [join(x, "suites") for x in search_path.split(":")]:
+    for dir in get_search_dirs(search_path, "suites"):
         for file in listdir(dir):
             path = join(dir, file)
             if isfile(path) and file.endswith(".json"):
@@ -162,18 +168,16 @@ app = Typer(help="List, inspect and run benchmark suites")
 @app.command("list")
 def list_suites(table: bool = Option(False, "--table", "-t")) -> None:
     """List available suites in the search path."""
-    from tabulate import tabulate
     from textwrap import shorten
 
     suites = get_suites(state["search_path"])
     echo(
-        tabulate(
+        format_table(
             (
                 (suite.name, shorten(suite.description, 40, placeholder="..."))
                 for suite in suites
             ),
-            headers=["Name", "Description"],
-            tablefmt="simple",
+            ["Name", "Description"],
         )
         if table
         else "\n".join(suite.name for suite in suites)
@@ -183,8 +187,6 @@ def list_suites(table: bool = Option(False, "--table", "-t")) -> None:
 @app.command("get")
 def get_suite_info(suite_name: str) -> None:
     """Get suite information."""
-    from tabulate import tabulate
-
     suite = find_suite(suite_name, state["search_path"])
     if suite is None:
         echo(f'ERROR: Suite "{suite_name}" not found in search path')
@@ -194,13 +196,12 @@ def get_suite_info(suite_name: str) -> None:
     echo(f"description: {suite.description}")
     echo()
     echo(
-        tabulate(
+        format_table(
             [
                 (run.benchmark.name, ", ".join(preset.name for preset in run.presets))
                 for run in suite.benchmark_runs
             ],
-            headers=["Benchmark", "Presets"],
-            tablefmt="simple",
+            ["Benchmark", "Presets"],
         )
     )
 
@@ -75,6 +75,7 @@ class BenchmarkDefinition(Serializable["BenchmarkDefinition"]):
         test_commands: "List[CommandInfo]",
         stats: "Union[CommandInfo, Dict[str, StatMatchInfo]]",
         virtualenv: bool,
+        parallel_safe: bool = False,
     ) -> None:
         """Create a BenchmarkDefinition object."""
         self.name = name
@@ -87,6 +88,7 @@ class BenchmarkDefinition(Serializable["BenchmarkDefinition"]):
         self.test_commands = test_commands
         self.stats = stats
         self.virtualenv = virtualenv
+        self.parallel_safe = parallel_safe
 
     @classmethod
     def deserialize(self_class, json: "Any") -> "BenchmarkDefinition":
@@ -117,6 +119,8 @@ class BenchmarkDefinition(Serializable["BenchmarkDefinition"]):
             },
             # virtualenv
             json.get("virtualenv", False),
+            # parallel_safe
+            json.get("parallel_safe", False),
         )
 
     @classmethod
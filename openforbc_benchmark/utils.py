@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Dict, Iterable, List, Optional
+    from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 
 from os import environ
@@ -62,10 +62,18 @@ class Runnable:
         """Return the contatenated args."""
         return argv_join(self.args)
 
-    def into_popen_args(self, env: "Dict[str, str]" = environ.copy()) -> PopenArgs:
-        """Transform into subprocess.Popen init args."""
+    def into_popen_args(self, env: "Optional[Dict[str, str]]" = None) -> PopenArgs:
+        """
+        Transform into subprocess.Popen init args.
+
+        :param env: base environment, defaults to (a copy of) the current one.
+        """
         from os.path import abspath
 
+        # Build a new environment on each call: tasks can run concurrently and must
+        # not see each other's variables
+        env = dict(environ if env is None else env)
+
         if self.path:
             env.update(
                 {
@@ -92,3 +100,57 @@ def argv_join(argv: "Iterable[str]") -> str:
     Backported for python3.6 from `shlex.join`.
     """
     return " ".join(quote(x) for x in argv)
+
+
+def format_table(rows: "Iterable[Sequence[Any]]", headers: "Sequence[str]") -> str:
+    """
+    Format *rows* into a plain text table, headed by *headers*.
+
+    Mimics `tabulate`'s "simple" table format: numeric columns are right aligned (on
+    the decimal point), any other column is left aligned and `None`s are left blank.
+    """
+    rows = [list(row) for row in rows]
+
+    columns: "List[List[str]]" = []
+    numeric: "List[bool]" = []
+    for i in range(len(headers)):
+        values = [row[i] for row in rows]
+        is_numeric = any(x is not None for x in values) and all(
+            isinstance(x, (int, float)) and not isinstance(x, bool)
+            for x in values
+            if x is not None
+        )
+        cells = [
+            "" if x is None else format(x, "g") if isinstance(x, float) else str(x)
+            for x in values
+        ]
+
+        if is_numeric:
+            # Pad fractional parts so that decimal points are aligned
+            fracs = [len(x) - x.index(".") if "." in x else 0 for x in cells]
+            cells = [
+                x + " " * (max(fracs) - frac) if x else x
+                for x, frac in zip(cells, fracs)
+            ]
+
+        columns.append(cells)
+        numeric.append(is_numeric)
+
+    widths = [
+        max([len(header) + 2] + [len(x) for x in cells])
+        for header, cells in zip(headers, columns)
+    ]
+
+    def format_line(cells: "Iterable[str]") -> str:
+        return "  ".join(
+            x.rjust(width) if right else x.ljust(width)
+            for x, width, right in zip(cells, widths, numeric)
+        ).rstrip()
+
+    return "\n".join(
+        [
+            format_line(headers),
+            "  ".join("-" * width for width in widths),
+            *(format_line(line) for line in zip(*columns)),
+        ]
+    )
@@ -1,10 +1,48 @@
+from json import dump
+from os import makedirs
+from os.path import join
 from typer.testing import CliRunner
 
-from openforbc_benchmark.cli.benchmark import app
+from typing import TYPE_CHECKING
+
+from openforbc_benchmark.benchmark import find_benchmark
+from openforbc_benchmark.cli.benchmark import app, CliBenchmarkRun
+from openforbc_benchmark.cli.state import state
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Dict
+    from pytest import MonkeyPatch
 
 runner = CliRunner()
 
 
+def make_benchmark(
+    search_dir: "Path", scripts: "Dict[str, str]", parallel_safe: bool = True
+) -> None:
+    """Create a benchmark "pb" with a preset running each of the shell *scripts*."""
+    benchmark_dir = join(search_dir, "benchmarks", "pb")
+    makedirs(join(benchmark_dir, "presets"))
+
+    with open(join(benchmark_dir, "benchmark.json"), "w") as file:
+        dump(
+            {
+                "name": "Parallel Benchmark",
+                "description": "Runs shell scripts",
+                "run_command": "sh -c",
+                "default_preset": next(iter(scripts)),
+                "test_command": "true",
+                "stats": {"data_1": {"regex": "data: (\\d+)"}},
+                "parallel_safe": parallel_safe,
+            },
+            file,
+        )
+
+    for name, script in scripts.items():
+        with open(join(benchmark_dir, "presets", f"{name}.json"), "w") as file:
+            dump({"args": [script]}, file)
+
+
 def test_benchmark_default_command() -> None:
     """Default command must be `list -t`."""
     default_result = runner.invoke(app)
@@ -69,6 +107,85 @@ def test_benchmark_run() -> None:
     assert "135246" in result.stdout
 
 
+def test_benchmark_run_parallel() -> None:
+    result = runner.invoke(
+        app, ["run", "-p", "2", "dummy_benchmark", "preset1", "preset2"]
+    )
+    assert result.exit_code == 0
+    assert "running presets sequentially" not in result.stdout
+    # Task output is tagged with its preset
+    assert "[preset1] data: 135246 --config=preset1" in result.stdout
+    assert "[preset2] data: 135246 --config=preset2" in result.stdout
+    assert result.stdout.count("135246") >= 4
+
+
+def test_benchmark_run_parallel_fallback(
+    tmp_path: "Path", monkeypatch: "MonkeyPatch"
+) -> None:
+    """Presets run sequentially, with a warning, when they can't run in parallel."""
+    result = runner.invoke(
+        app, ["run", "-p", "2", "dummy_benchmark", "preset1", "preset1"]
+    )
+    assert result.exit_code == 0
+    assert "WARNING: Repeated presets can't run in parallel" in result.stdout
+    assert "[preset1]" not in result.stdout
+
+    make_benchmark(tmp_path, {"first": "echo data: 1", "second": "echo data: 2"}, False)
+    monkeypatch.setitem(state, "search_path", str(tmp_path))
+
+    result = runner.invoke(app, ["run", "-p", "2", "pb", "first", "second"])
+    assert result.exit_code == 0
+    assert 'WARNING: Benchmark "pb" is not marked as parallel_safe' in result.stdout
+    assert "[first]" not in result.stdout
+    assert result.stdout.splitlines()[-2:] == [
+        "first     data_1        1",
+        "second    data_1        2",
+    ]
+
+
+def test_benchmark_run_parallel_failure(
+    tmp_path: "Path", monkeypatch: "MonkeyPatch"
+) -> None:
+    """Presets queued after a failure must not run."""
+    make_benchmark(
+        tmp_path,
+        {
+            "slow": "sleep 1; echo data: 1",
+            "fail": "exit 3",
+            "third": "echo data: 3",
+        },
+    )
+    monkeypatch.setitem(state, "search_path", str(tmp_path))
+
+    result = runner.invoke(app, ["run", "-p", "2", "pb", "slow", "fail", "third"])
+    assert result.exit_code == 1
+    assert 'ERROR: Benchmark "pb" failed' in result.stdout
+    assert "failed with return code 3" in result.stdout
+    assert 'preset "slow"' in result.stdout
+    assert 'preset "third"' not in result.stdout
+
+
+def test_benchmark_run_task_output(tmp_path: "Path") -> None:
+    """Output without newlines (e.g. progress bars) is logged as is."""
+    make_benchmark(
+        tmp_path,
+        {
+            "progress": 'i=0; while [ $i -lt 20000 ]; do printf "\\r%d%%" $i; '
+            'i=$((i + 1)); done; printf "\\ndata: 7"'
+        },
+    )
+    benchmark = find_benchmark("pb", str(tmp_path))
+    assert benchmark is not None
+
+    run = CliBenchmarkRun(benchmark.run([benchmark.get_default_preset()]))
+    run.start()
+    assert run.stats == {"progress": {"data_1": 7}}
+
+    with open(join(run.log_dir, "run_progress.1.out.log"), "rb") as file:
+        output = file.read().split(b"\n", 1)[1]
+    assert output == "".join(f"\r{i}%" for i in range(20000)).encode() + b"\ndata: 7"
+
+
 def test_benchmark_run_test_preset() -> None:
     result = runner.invoke(app, ["run", "-t", "dummy_benchmark"])
     assert result.exit_code == 0
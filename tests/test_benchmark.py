@@ -7,6 +7,8 @@ from openforbc_benchmark.benchmark import (
     Preset,
     find_benchmark,
     get_benchmarks,
+    get_search_dirs,
+    iter_benchmark_dirs,
 )
 from openforbc_benchmark.json import (
     BenchmarkDefinition,
@@ -89,6 +91,13 @@ def test_benchmark_from_definition_file() -> None:
     assert isinstance(benchmark.stats, dict)
     assert benchmark.stats["data_1"].regex == r"data: (\d+)"
     assert not benchmark.virtualenv
+    assert benchmark.parallel_safe
+
+
+def test_benchmark_get_id() -> None:
+    benchmark = get_dummy_benchmark()
+    assert benchmark.get_id() == "dummy_benchmark"
+    assert benchmark.get_id() is benchmark.get_id()
 
 
 def test_benchmark_get_presets() -> None:
@@ -219,3 +228,25 @@ def test_find_benchmark() -> None:
     benchmark = find_benchmark("dummy_benchmark", O4BC_BENCH_DIR)
     assert benchmark is not None
     assert benchmark.name == "Dummy Benchmark"
+
+
+def test_find_benchmark_cached() -> None:
+    benchmark = find_benchmark("dummy_benchmark", O4BC_BENCH_DIR)
+    assert benchmark is not None
+    assert find_benchmark("dummy_benchmark", O4BC_BENCH_DIR) is benchmark
+    assert find_benchmark("missing_benchmark", O4BC_BENCH_DIR) is None
+    assert find_benchmark("../benchmarks/dummy_benchmark", O4BC_BENCH_DIR) is None
+
+
+def test_iter_benchmark_dirs() -> None:
+    dirs = dict(iter_benchmark_dirs(O4BC_BENCH_DIR))
+    assert dirs["dummy_benchmark"] == join(
+        O4BC_BENCH_DIR, "benchmarks", "dummy_benchmark", "benchmark.json"
+    )
+
+
+def test_get_search_dirs() -> None:
+    assert get_search_dirs("a:b:", "benchmarks") == (
+        join("a", "benchmarks"),
+        join("b", "benchmarks"),
+    )
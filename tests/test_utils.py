@@ -0,0 +1,31 @@
+from openforbc_benchmark.utils import format_table, Runnable
+
+
+def test_format_table() -> None:
+    table = format_table(
+        [("preset1", "data_1", 135246), ("preset2", "data_1", 1.5)],
+        ["Preset", "Stat", "Value"],
+    )
+    assert table.splitlines() == [
+        "Preset    Stat       Value",
+        "--------  ------  --------",
+        "preset1   data_1  135246",
+        "preset2   data_1       1.5",
+    ]
+
+
+def test_format_table_empty() -> None:
+    assert format_table([], ["Name", "Args"]) == "Name    Args\n------  ------"
+
+
+def test_format_table_none() -> None:
+    table = format_table([("preset1", None), ("preset2", "-c 2")], ["Name", "Args"])
+    assert table.splitlines()[2:] == ["preset1", "preset2  -c 2"]
+
+
+def test_runnable_into_popen_args_env() -> None:
+    a = Runnable(["true"], env={"CUDA_VISIBLE_DEVICES": "0"}).into_popen_args()
+    b = Runnable(["true"], env={"OTHER": "1"}).into_popen_args()
+    assert a["env"] is not b["env"]
+    assert a["env"] is not None and "OTHER" not in a["env"]
+    assert b["env"] is not None and "CUDA_VISIBLE_DEVICES" not in b["env"]